@@ -1,5 +1,6 @@
 import array
 import collections
+import functools
 import io
 import itertools
 import os
@@ -33,6 +34,16 @@ __dirname__ = os.path.dirname(__file__)
 FilterLinesCallback = Callable[[List[Union[float, str]]], bool]
 
 
+@functools.lru_cache(maxsize=128)
+def _read_fixture(fixture_path: str, mtime: float) -> str:
+    """
+    Returns the contents of a fixture file. mtime is only part of the cache key,
+    so a fixture edited during the session is read again
+    """
+    with open(fixture_path, "r") as fixtureFile:
+        return fixtureFile.read()
+
+
 class TemporarilyMakeRootExportable:
     """
     Ensures a potential_root will be exportable
@@ -426,8 +437,7 @@ class XPlaneTestCase(unittest.TestCase):
         Highly recommended, with as simple a function as possible to prevent fixture fragility.
         """
 
-        with open(str(fixturePath), "r") as fixtureFile:
-            fixtureOutput = fixtureFile.read()
+        fixtureOutput = _read_fixture(str(fixturePath), os.path.getmtime(fixturePath))
 
         return self.assertFilesEqual(
             fileOutput, fixtureOutput, filterCallback, floatTolerance
@@ -9,7 +9,7 @@ import inspect
 import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 import bpy
 
@@ -47,95 +47,140 @@ from io_xplane2blender.xplane_utils.xplane_gear_animation import (
 
 __dirname__ = os.path.dirname(__file__)
 
+# Name and location of each empty in a tricycle gear configuration
+TRICYCLE_GEAR = (
+    ("nose_gear", (0, 2, -1)),
+    ("main_left", (-2, 0, -1)),
+    ("main_right", (2, 0, -1)),
+)
+
+# Detection cases: name, location, expected gear type and, for name based
+# detection, expected gear index (None where only the position decides)
+GEAR_DETECTION_CASES = (
+    # By name
+    ("nose_gear", (0, 2, -1), GEAR_TYPE_NOSE, GEAR_INDEX_NOSE),
+    ("main_left_gear", (-2, 0, -1), GEAR_TYPE_MAIN_LEFT, GEAR_INDEX_MAIN_LEFT),
+    ("main_right_gear", (2, 0, -1), GEAR_TYPE_MAIN_RIGHT, GEAR_INDEX_MAIN_RIGHT),
+    # By position
+    ("gear_1", (0, 3, -1), GEAR_TYPE_NOSE, None),
+    ("gear_2", (-3, 0, -1), GEAR_TYPE_MAIN_LEFT, None),
+    ("gear_3", (3, 0, -1), GEAR_TYPE_MAIN_RIGHT, None),
+)
+
+
+def _joined_lower(messages: Iterable[str]) -> str:
+    """
+    Lower cased messages, one per line, so a single substring test can
+    check whether any message mentions something
+    """
+    return "\n".join(messages).lower()
+
 
 class TestLandingGearSystem(XPlaneTestCase):
     """Test suite for the complete landing gear system"""
     
-    def setUp(self):
-        """Set up test environment"""
-        # Clear existing scene
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
+    _VALID_GEAR_TYPES = frozenset(
+        (GEAR_TYPE_NOSE, GEAR_TYPE_MAIN_LEFT, GEAR_TYPE_MAIN_RIGHT, GEAR_TYPE_TAIL)
+    )
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the wheel template once, unlinked, for create_gear_empty to copy"""
+        super().setUpClass()
+        cls.gear_template = bpy.data.objects.new("gear_template", None)
+        cls.gear_template.empty_display_type = "PLAIN_AXES"
+        cls.gear_template.xplane.special_empty_props.special_type = EMPTY_USAGE_WHEEL
+        cls.gear_template.use_fake_user = True
+        cls.fixtures = [cls.gear_template]
         
         # Set scene to aircraft export type
         bpy.context.scene.xplane.version = "1210"
         if hasattr(bpy.context.scene.xplane, 'export_type'):
             bpy.context.scene.xplane.export_type = EXPORT_TYPE_AIRCRAFT
     
+    @classmethod
+    def tearDownClass(cls):
+        bpy.data.batch_remove(cls.fixtures)
+        super().tearDownClass()
+    
+    def _remove_non_fixture_objects(self) -> None:
+        """Remove every object except the class's fixtures, which stay unlinked for reuse"""
+        bpy.data.batch_remove(
+            [obj for obj in bpy.data.objects if obj not in self.fixtures]
+        )
+    
+    def setUp(self):
+        """Set up test environment"""
+        # Clear whatever the scene started with
+        self._remove_non_fixture_objects()
+    
     def tearDown(self):
         """Clean up after tests"""
-        # Clear scene
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
+        # Remove the objects this test created
+        self._remove_non_fixture_objects()
     
-    def create_gear_empty(self, name: str, location: tuple = (0, 0, 0)) -> bpy.types.Object:
-        """Create a gear empty object for testing"""
-        bpy.ops.object.empty_add(type='PLAIN_AXES', location=location)
-        obj = bpy.context.active_object
+    def create_gear_empty(
+        self, name: str, location: tuple = (0, 0, 0), update_view_layer: bool = True
+    ) -> bpy.types.Object:
+        """
+        Create a gear empty object for testing, copied from the wheel template.
+        Pass update_view_layer=False when creating several at once, then
+        update the view layer before reading their matrices
+        """
+        obj = self.gear_template.copy()
         obj.name = name
+        obj.location = location
+        obj.use_fake_user = False
+        bpy.context.collection.objects.link(obj)
         
-        # Set up as wheel
-        obj.xplane.special_empty_props.special_type = EMPTY_USAGE_WHEEL
+        # Detection and validation read matrix_world, which only the
+        # depsgraph fills in (bpy.ops.object.empty_add did this for us)
+        if update_view_layer:
+            bpy.context.view_layer.update()
         
         return obj
     
-    def test_gear_detection_by_name(self):
-        """Test gear detection based on object names"""
-        # Test nose gear detection
-        nose_gear = self.create_gear_empty("nose_gear", (0, 2, -1))
-        result = detect_gear_configuration(nose_gear)
-        
-        self.assertEqual(result.gear_type, GEAR_TYPE_NOSE)
-        self.assertEqual(result.gear_index, GEAR_INDEX_NOSE)
-        self.assertGreater(result.confidence, 0.5)
-        
-        # Test main left gear detection
-        main_left = self.create_gear_empty("main_left_gear", (-2, 0, -1))
-        result = detect_gear_configuration(main_left)
-        
-        self.assertEqual(result.gear_type, GEAR_TYPE_MAIN_LEFT)
-        self.assertEqual(result.gear_index, GEAR_INDEX_MAIN_LEFT)
-        self.assertGreater(result.confidence, 0.5)
-        
-        # Test main right gear detection
-        main_right = self.create_gear_empty("main_right_gear", (2, 0, -1))
-        result = detect_gear_configuration(main_right)
-        
-        self.assertEqual(result.gear_type, GEAR_TYPE_MAIN_RIGHT)
-        self.assertEqual(result.gear_index, GEAR_INDEX_MAIN_RIGHT)
-        self.assertGreater(result.confidence, 0.5)
+    def create_tricycle_gear(self) -> List[bpy.types.Object]:
+        """Create fresh wheel empties for a tricycle gear configuration"""
+        return [
+            self.create_gear_empty(name, location)
+            for name, location in TRICYCLE_GEAR
+        ]
     
-    def test_gear_detection_by_position(self):
-        """Test gear detection based on spatial position"""
-        # Test forward position (nose gear)
-        forward_gear = self.create_gear_empty("gear_1", (0, 3, -1))
-        result = detect_gear_configuration(forward_gear)
-        
-        self.assertEqual(result.gear_type, GEAR_TYPE_NOSE)
-        
-        # Test left position (main left)
-        left_gear = self.create_gear_empty("gear_2", (-3, 0, -1))
-        result = detect_gear_configuration(left_gear)
-        
-        self.assertEqual(result.gear_type, GEAR_TYPE_MAIN_LEFT)
-        
-        # Test right position (main right)
-        right_gear = self.create_gear_empty("gear_3", (3, 0, -1))
-        result = detect_gear_configuration(right_gear)
-        
-        self.assertEqual(result.gear_type, GEAR_TYPE_MAIN_RIGHT)
+    def test_gear_detection_batch(self):
+        """Test gear detection based on object names and on spatial position"""
+        gears = [
+            (
+                self.create_gear_empty(name, location, update_view_layer=False),
+                gear_type,
+                gear_index,
+            )
+            for name, location, gear_type, gear_index in GEAR_DETECTION_CASES
+        ]
+        # Position based detection reads matrix_world
+        bpy.context.view_layer.update()
+        
+        for gear, gear_type, gear_index in gears:
+            with self.subTest(name=gear.name):
+                result = detect_gear_configuration(gear)
+                
+                self.assertEqual(result.gear_type, gear_type)
+                # Name matches also pin down the index with good confidence
+                if gear_index is not None:
+                    self.assertEqual(result.gear_index, gear_index)
+                    self.assertGreater(result.confidence, 0.5)
     
     def test_auto_configuration(self):
         """Test automatic gear configuration"""
         # Create gear with auto-detection enabled
         gear = self.create_gear_empty("nose_gear_wheel", (0, 2, -1))
-        gear.xplane.special_empty_props.wheel_props.auto_detect_gear = True
+        wheel_props = gear.xplane.special_empty_props.wheel_props
+        wheel_props.auto_detect_gear = True
         
         # Apply auto-configuration
         success = apply_auto_configuration(gear)
         
         self.assertTrue(success)
-        wheel_props = gear.xplane.special_empty_props.wheel_props
         self.assertEqual(wheel_props.gear_type, GEAR_TYPE_NOSE)
         self.assertEqual(wheel_props.gear_index, GEAR_INDEX_NOSE)
     
@@ -167,16 +212,14 @@ class TestLandingGearSystem(XPlaneTestCase):
         self.assertGreater(len(result.errors), 0)
         
         # Check for specific error messages
-        error_messages = [str(error) for error in result.errors]
-        self.assertTrue(any("gear index" in msg.lower() for msg in error_messages))
-        self.assertTrue(any("wheel index" in msg.lower() for msg in error_messages))
+        error_text = _joined_lower(map(str, result.errors))
+        self.assertIn("gear index", error_text)
+        self.assertIn("wheel index", error_text)
     
     def test_scene_gear_validation_tricycle(self):
         """Test scene validation for tricycle gear configuration"""
         # Create tricycle configuration
-        nose_gear = self.create_gear_empty("nose_gear", (0, 2, -1))
-        main_left = self.create_gear_empty("main_left", (-2, 0, -1))
-        main_right = self.create_gear_empty("main_right", (2, 0, -1))
+        nose_gear, main_left, main_right = self.create_tricycle_gear()
         
         # Configure gear properties
         for gear, gear_type, gear_index in [
@@ -213,8 +256,7 @@ class TestLandingGearSystem(XPlaneTestCase):
         self.assertGreater(len(result.errors), 0)
         
         # Check for duplicate index error
-        error_messages = [str(error) for error in result.errors]
-        self.assertTrue(any("duplicate" in msg.lower() for msg in error_messages))
+        self.assertIn("duplicate", _joined_lower(map(str, result.errors)))
     
     def test_gear_animation_detection(self):
         """Test gear animation detection"""
@@ -240,7 +282,7 @@ class TestLandingGearSystem(XPlaneTestCase):
         issues = validate_animation_compatibility(gear)
         
         self.assertGreater(len(issues), 0)
-        self.assertTrue(any("dataref" in issue.lower() for issue in issues))
+        self.assertIn("dataref", _joined_lower(issues))
     
     def test_gear_auto_detection_scene(self):
         """Test auto-detection for entire scene"""
@@ -265,22 +307,19 @@ class TestLandingGearSystem(XPlaneTestCase):
         # Check that each gear was detected with reasonable confidence
         for obj_name, result in results.items():
             self.assertGreater(result.confidence, 0.2)
-            self.assertIn(result.gear_type, [
-                GEAR_TYPE_NOSE, GEAR_TYPE_MAIN_LEFT, 
-                GEAR_TYPE_MAIN_RIGHT, GEAR_TYPE_TAIL
-            ])
+            self.assertIn(result.gear_type, self._VALID_GEAR_TYPES)
     
     def test_gear_configuration_recommendations(self):
         """Test gear configuration recommendations"""
         # Test with no gear
         recommendations = get_gear_configuration_recommendations()
         self.assertGreater(len(recommendations), 0)
-        self.assertTrue(any("add landing gear" in rec.lower() for rec in recommendations))
+        self.assertIn("add landing gear", _joined_lower(recommendations))
         
         # Test with single gear
         gear = self.create_gear_empty("single_gear", (0, 0, -1))
         recommendations = get_gear_configuration_recommendations()
-        self.assertTrue(any("more landing gear" in rec.lower() for rec in recommendations))
+        self.assertIn("more landing gear", _joined_lower(recommendations))
     
     def test_gear_retraction_animation_setup(self):
         """Test retraction animation setup"""
@@ -349,5 +388,4 @@ class TestLandingGearSystem(XPlaneTestCase):
         # proper ATTR_landing_gear directives
 
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+runTestCases([TestLandingGearSystem])
\ No newline at end of file
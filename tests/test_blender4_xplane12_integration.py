@@ -12,65 +12,271 @@ This test suite validates:
 Integrated into the main XPlane2Blender test framework.
 """
 
+import contextlib
+import functools
 import inspect
+import operator
 import os
 import sys
 import time
 from pathlib import Path
-from typing import Tuple
+from typing import AbstractSet, Any, Dict, FrozenSet, List, Optional, Tuple
 
 import bpy
 
-from io_xplane2blender import xplane_config
+from io_xplane2blender import xplane_config, xplane_ui
 from io_xplane2blender.tests import *
 from io_xplane2blender.tests import test_creation_helpers
+from io_xplane2blender.xplane_utils.xplane_gear_validation import validate_gear_object
+from io_xplane2blender.xplane_utils.xplane_material_converter import (
+    convert_blender_material_to_xplane,
+)
+from io_xplane2blender.xplane_utils.xplane_rain_validation import validate_rain_system
+from io_xplane2blender.xplane_utils.xplane_texture_validation import (
+    validate_texture_system,
+)
 
 __dirname__ = Path(__file__).parent
 
+# getattr default for "attribute not there", so probing and reading take one lookup
+_MISSING = object()
+
+RESULT_CATEGORIES = (
+    'ui_compatibility',
+    'xplane12_features',
+    'material_integration',
+    'integration_tests',
+    'performance_tests',
+)
+RESULT_FIELDS = ('test', 'success', 'message', 'details')
+# Message lists a validate_* result may contain
+VALIDATION_MESSAGE_KEYS = ('errors', 'warnings', 'info')
+
+# Same 2m cube as bpy.ops.mesh.primitive_cube_add
+CUBE_VERTS = tuple((x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1))
+CUBE_FACES = (
+    (0, 1, 3, 2),
+    (4, 6, 7, 5),
+    (0, 4, 5, 1),
+    (2, 3, 7, 6),
+    (0, 2, 6, 4),
+    (1, 5, 7, 3),
+)
+
+PANEL_CLASSES = (
+    'MATERIAL_PT_xplane',
+    'OBJECT_PT_xplane',
+    'SCENE_PT_xplane',
+)
+
+# (property, test value) pairs probed on the X-Plane 12 property groups
+AUTO_DETECT_SPECS = (
+    ('auto_detect_principled_bsdf', True),
+    ('auto_detect_normal_map_nodes', True),
+    ('auto_detect_image_texture_nodes', True),
+)
+RAIN_FRICTION_SPECS = (
+    ('rain_friction_enabled', True),
+    ('rain_friction_dataref', "sim/weather/rain_percent"),
+    ('rain_friction_dry_coefficient', 1.0),
+    ('rain_friction_wet_coefficient', 0.3),
+)
+# 4 sources: pilot side, copilot side, front window, additional
+THERMAL_SOURCE_SPECS = tuple((f'thermal_source_{i}_enabled', True) for i in range(1, 5))
+WIPER_SPECS = tuple((f'wiper_{i}_enabled', True) for i in range(1, 5))
+# enable toggle -> (number, settings pointer name, settings getter)
+THERMAL_SOURCE_SETTINGS = {
+    f'thermal_source_{i}_enabled': (i, f'thermal_source_{i}', operator.attrgetter(f'thermal_source_{i}'))
+    for i in range(1, 5)
+}
+WIPER_SETTINGS = {
+    f'wiper_{i}_enabled': (i, f'wiper_{i}', operator.attrgetter(f'wiper_{i}'))
+    for i in range(1, 5)
+}
+GEAR_SPECS = (
+    ('gear_type', 'NOSE'),
+    ('gear_index', 'GEAR_INDEX_NOSE'),
+    ('wheel_index', 0),
+    ('enable_retraction', True),
+)
+
+# Walk the object -> layer settings pointer chain in one C-level call
+_get_rain_settings = operator.attrgetter('xplane.layer.rain')
+_get_layer_settings = operator.attrgetter('xplane.layer.rain', 'xplane.layer.texture_maps')
+
+
+@functools.lru_cache(maxsize=None)
+def _xplane_ui_attrs() -> FrozenSet[str]:
+    """Names defined in xplane_ui, collected once per process"""
+    return frozenset(dir(xplane_ui))
+
+
+@functools.lru_cache(maxsize=None)
+def _rna_keys_for_type(struct_type: type) -> FrozenSet[str]:
+    return frozenset(struct_type.bl_rna.properties.keys())
+
+
+def _rna_keys(struct: bpy.types.bpy_struct) -> FrozenSet[str]:
+    """
+    Names of the RNA properties of struct, looked up once per struct type
+    (e.g. once for every XPlaneRainSettings) rather than once per instance
+    """
+    return _rna_keys_for_type(type(struct))
+
+
+def _make_cube(name: str, location: Tuple[float, float, float] = (0, 0, 0)) -> bpy.types.Object:
+    """
+    Creates a cube object linked to the active collection, like primitive_cube_add.
+    Built through bpy.data rather than bpy.ops to skip operator dispatch and undo pushes
+    """
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(CUBE_VERTS, [], CUBE_FACES)
+    ob = bpy.data.objects.new(name, mesh)
+    ob.location = location
+    bpy.context.collection.objects.link(ob)
+    return ob
+
+
+def _set_present(owner: bpy.types.bpy_struct, values: Dict[str, Any]) -> None:
+    """Sets the values whose names exist on owner, silently skipping the rest"""
+    for name in values.keys() & _rna_keys(owner):
+        setattr(owner, name, values[name])
+
+
+def _snapshot_props(group: bpy.types.bpy_struct) -> Dict[str, Any]:
+    """
+    Returns the writable RNA property values of group,
+    recursing into nested PropertyGroups
+    """
+    snapshot = {}
+    for prop in group.bl_rna.properties:
+        if prop.identifier == "rna_type" or prop.type == "COLLECTION":
+            continue
+        value = getattr(group, prop.identifier)
+        if prop.type == "POINTER":
+            if isinstance(value, bpy.types.PropertyGroup):
+                snapshot[prop.identifier] = _snapshot_props(value)
+        elif not prop.is_readonly:
+            snapshot[prop.identifier] = tuple(value) if getattr(prop, "is_array", False) else value
+    return snapshot
+
+
+def _restore_props(group: bpy.types.bpy_struct, snapshot: Dict[str, Any]) -> None:
+    """
+    Writes a snapshot taken with _snapshot_props back to group.
+    Only properties that changed are written, so untouched properties
+    don't fire their update callbacks
+    """
+    for name, value in snapshot.items():
+        current = getattr(group, name)
+        if isinstance(value, dict):
+            _restore_props(current, value)
+        elif (tuple(current) if isinstance(value, tuple) else current) != value:
+            setattr(group, name, value)
+
 
 class TestBlender4XPlane12Integration(XPlaneTestCase):
     """Comprehensive integration test for Blender 4+ and X-Plane 12 features"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Creates the cube, empty, and material shared by the tests"""
+        super().setUpClass()
+        cls.fixture_cube = _make_cube("test_fixture_cube")
+        
+        cls.fixture_empty = test_creation_helpers.create_datablock_empty(
+            test_creation_helpers.DatablockInfo("EMPTY", "test_fixture_empty")
+        )
+        
+        # Node-enabled material shared by the material tests, which only read its node tree
+        cls.fixture_material = bpy.data.materials.new(name="test_fixture_material")
+        cls.fixture_material.use_nodes = True
+    
+    @classmethod
+    def tearDownClass(cls):
+        # setUpClass may have failed part way, so only remove what it made
+        cube = getattr(cls, "fixture_cube", None)
+        fixtures = (
+            cube,
+            cube.data if cube is not None else None,
+            getattr(cls, "fixture_empty", None),
+            getattr(cls, "fixture_material", None),
+        )
+        bpy.data.batch_remove([fixture for fixture in fixtures if fixture is not None])
+        super().tearDownClass()
+    
+    @contextlib.contextmanager
+    def _preserved(self, obj: bpy.types.Object):
+        """
+        Restores the X-Plane settings and, for meshes, the material slots
+        of a shared fixture once a test is done with it
+        """
+        snapshot = _snapshot_props(obj.xplane)
+        materials = obj.data.materials[:] if obj.type == "MESH" else None
+        try:
+            yield obj
+        finally:
+            _restore_props(obj.xplane, snapshot)
+            if materials is not None and obj.data.materials[:] != materials:
+                obj.data.materials.clear()
+                for material in materials:
+                    obj.data.materials.append(material)
+    
     def setUp(self):
         super().setUp()
+        # Each category keeps one list per field instead of one dict per result
         self.test_results = {
-            'ui_compatibility': [],
-            'xplane12_features': [],
-            'material_integration': [],
-            'integration_tests': [],
-            'performance_tests': [],
+            category: {field: [] for field in RESULT_FIELDS}
+            for category in RESULT_CATEGORIES
+        }
+        self.diagnostics = {
             'errors': [],
             'warnings': []
         }
-        
+    
     def _log_test_result(self, category: str, test_name: str, success: bool, message: str, details: str = ""):
         """Log test result for reporting"""
-        result = {
-            'test': test_name,
-            'success': success,
-            'message': message,
-            'details': details,
-            'blender_version': bpy.app.version
-        }
-        self.test_results[category].append(result)
+        columns = self.test_results[category]
+        columns['test'].append(test_name)
+        columns['success'].append(success)
+        columns['message'].append(message)
+        columns['details'].append(details)
         
         if not success:
-            self.test_results['errors'].append(f"{test_name}: {message}")
+            self.diagnostics['errors'].append(f"{test_name}: {message}")
+    
+    def _probe_props(self, owner: bpy.types.bpy_struct, specs: Tuple[Tuple[str, Any], ...],
+                     category: str, test_name_format: str, label: str,
+                     owner_attrs: Optional[AbstractSet[str]] = None,
+                     report_value: bool = False) -> List[str]:
+        """
+        Sets each (property, value) in specs on owner, logging whether the property exists.
+        owner_attrs can pass in an already collected set of owner's property names.
+        report_value appends the value read back after setting to the success message.
+        Returns the names of the properties that were found, in specs order
+        """
+        if owner_attrs is None:
+            owner_attrs = _rna_keys(owner)
+        present = []
+        for prop, value in specs:
+            test_name = test_name_format.format(prop)
+            if prop in owner_attrs:
+                setattr(owner, prop, value)
+                present.append(prop)
+                message = f"{label} {prop} accessible"
+                if report_value:
+                    message += f", set to: {getattr(owner, prop)}"
+                self._log_test_result(category, test_name, True, message)
+            else:
+                self._log_test_result(category, test_name, False, f"{label} {prop} not accessible")
+        return present
     
     def test_ui_panel_compatibility(self):
         """Test Blender 4+ UI panel compatibility"""
         try:
-            from io_xplane2blender import xplane_ui
-            
             # Test key panel classes
-            panel_classes = [
-                'MATERIAL_PT_xplane',
-                'OBJECT_PT_xplane', 
-                'SCENE_PT_xplane'
-            ]
-            
-            for panel_class in panel_classes:
-                if hasattr(xplane_ui, panel_class):
+            for panel_class in PANEL_CLASSES:
+                if panel_class in _xplane_ui_attrs():
                     panel = getattr(xplane_ui, panel_class)
                     if hasattr(panel, 'poll') and hasattr(panel, 'draw'):
                         self._log_test_result('ui_compatibility', f'{panel_class}_registration', True,
@@ -82,18 +288,13 @@ class TestBlender4XPlane12Integration(XPlaneTestCase):
                     self._log_test_result('ui_compatibility', f'{panel_class}_registration', False,
                                         f"Panel {panel_class} not found")
             
-            # Test material panel functionality
-            test_mat = bpy.data.materials.new(name="test_ui_material")
-            
-            if hasattr(test_mat, 'xplane'):
+            # Test material panel functionality, the registered RNA answers this without a material
+            if 'xplane' in bpy.types.Material.bl_rna.properties:
                 self._log_test_result('ui_compatibility', 'material_properties_access', True,
                                     "XPlane material properties accessible")
             else:
                 self._log_test_result('ui_compatibility', 'material_properties_access', False,
                                     "XPlane material properties not accessible")
-            
-            bpy.data.materials.remove(test_mat)
-            
         except Exception as e:
             self._log_test_result('ui_compatibility', 'panel_compatibility_test', False,
                                 f"UI panel compatibility test failed: {str(e)}")
@@ -101,42 +302,24 @@ class TestBlender4XPlane12Integration(XPlaneTestCase):
     def test_blender4_integration_properties(self):
         """Test Blender 4+ integration properties"""
         try:
-            bpy.ops.mesh.primitive_cube_add()
-            test_obj = bpy.context.active_object
-            test_obj.name = "test_blender4_integration"
-            
-            if hasattr(test_obj.xplane, 'layer'):
-                layer = test_obj.xplane.layer
-                if hasattr(layer, 'texture_maps'):
-                    texture_maps = layer.texture_maps
-                    
-                    # Test Blender 4+ integration property
-                    if hasattr(texture_maps, 'blender_material_integration'):
-                        texture_maps.blender_material_integration = True
-                        self._log_test_result('ui_compatibility', 'blender4_integration_property', True,
-                                            "Blender 4+ integration property accessible and settable")
+            with self._preserved(self.fixture_cube) as test_obj:
+                layer = getattr(test_obj.xplane, 'layer', _MISSING)
+                if layer is not _MISSING:
+                    texture_maps = getattr(layer, 'texture_maps', _MISSING)
+                    if texture_maps is not _MISSING:
                         
-                        # Test auto-detection properties
-                        auto_detect_props = [
-                            'auto_detect_principled_bsdf',
-                            'auto_detect_normal_map_nodes', 
-                            'auto_detect_image_texture_nodes'
-                        ]
-                        
-                        for prop in auto_detect_props:
-                            if hasattr(texture_maps, prop):
-                                setattr(texture_maps, prop, True)
-                                self._log_test_result('ui_compatibility', f'{prop}_property', True,
-                                                    f"Property {prop} accessible")
-                            else:
-                                self._log_test_result('ui_compatibility', f'{prop}_property', False,
-                                                    f"Property {prop} not accessible")
-                    else:
-                        self._log_test_result('ui_compatibility', 'blender4_integration_property', False,
-                                            "Blender 4+ integration property not accessible")
-            
-            bpy.data.objects.remove(test_obj, do_unlink=True)
-            
+                        # Test Blender 4+ integration property
+                        if 'blender_material_integration' in _rna_keys(texture_maps):
+                            texture_maps.blender_material_integration = True
+                            self._log_test_result('ui_compatibility', 'blender4_integration_property', True,
+                                                "Blender 4+ integration property accessible and settable")
+                            
+                            # Test auto-detection properties
+                            self._probe_props(texture_maps, AUTO_DETECT_SPECS, 'ui_compatibility',
+                                              '{}_property', "Property")
+                        else:
+                            self._log_test_result('ui_compatibility', 'blender4_integration_property', False,
+                                                "Blender 4+ integration property not accessible")
         except Exception as e:
             self._log_test_result('ui_compatibility', 'blender4_integration_properties', False,
                                 f"Blender 4+ integration properties test failed: {str(e)}")
@@ -144,62 +327,37 @@ class TestBlender4XPlane12Integration(XPlaneTestCase):
     def test_xplane12_rain_system(self):
         """Test X-Plane 12 Rain System (RAIN_scale, RAIN_friction)"""
         try:
-            bpy.ops.mesh.primitive_cube_add()
-            test_obj = bpy.context.active_object
-            test_obj.name = "test_rain_system"
-            test_obj.xplane.isExportableRoot = True
-            
-            rain_props = test_obj.xplane.layer.rain
-            
-            # Test RAIN_scale
-            if hasattr(rain_props, 'rain_scale'):
-                rain_props.rain_scale = 0.7
-                self._log_test_result('xplane12_features', 'rain_scale_property', True,
-                                    f"RAIN_scale property accessible, value: {rain_props.rain_scale}")
-            else:
-                self._log_test_result('xplane12_features', 'rain_scale_property', False,
-                                    "RAIN_scale property not accessible")
-            
-            # Test RAIN_friction properties
-            friction_props = [
-                'rain_friction_enabled',
-                'rain_friction_dataref',
-                'rain_friction_dry_coefficient', 
-                'rain_friction_wet_coefficient'
-            ]
-            
-            for prop in friction_props:
-                if hasattr(rain_props, prop):
-                    if prop == 'rain_friction_enabled':
-                        setattr(rain_props, prop, True)
-                    elif prop == 'rain_friction_dataref':
-                        setattr(rain_props, prop, "sim/weather/rain_percent")
-                    elif 'coefficient' in prop:
-                        setattr(rain_props, prop, 1.0 if 'dry' in prop else 0.3)
-                    
-                    self._log_test_result('xplane12_features', f'rain_friction_{prop}', True,
-                                        f"Rain friction property {prop} accessible")
-                else:
-                    self._log_test_result('xplane12_features', f'rain_friction_{prop}', False,
-                                        f"Rain friction property {prop} not accessible")
-            
-            # Test rain validation system
-            try:
-                from io_xplane2blender.xplane_utils.xplane_rain_validation import validate_rain_system
-                results = validate_rain_system(rain_props, "test_rain.obj", 1200)
+            with self._preserved(self.fixture_cube) as test_obj:
+                test_obj.xplane.isExportableRoot = True
                 
-                if isinstance(results, dict) and 'errors' in results:
-                    self._log_test_result('xplane12_features', 'rain_validation', True,
-                                        f"Rain validation system working, found {len(results['errors'])} errors, {len(results.get('warnings', []))} warnings")
+                rain_props = _get_rain_settings(test_obj)
+                
+                # Test RAIN_scale
+                if 'rain_scale' in _rna_keys(rain_props):
+                    rain_props.rain_scale = 0.7
+                    self._log_test_result('xplane12_features', 'rain_scale_property', True,
+                                        f"RAIN_scale property accessible, value: {rain_props.rain_scale}")
                 else:
+                    self._log_test_result('xplane12_features', 'rain_scale_property', False,
+                                        "RAIN_scale property not accessible")
+                
+                # Test RAIN_friction properties
+                self._probe_props(rain_props, RAIN_FRICTION_SPECS, 'xplane12_features',
+                                  'rain_friction_{}', "Rain friction property")
+                
+                # Test rain validation system
+                try:
+                    results = validate_rain_system(rain_props, "test_rain.obj", 1200)
+                    
+                    if isinstance(results, dict) and 'errors' in results:
+                        self._log_test_result('xplane12_features', 'rain_validation', True,
+                                            f"Rain validation system working, found {len(results['errors'])} errors, {len(results.get('warnings', ()))} warnings")
+                    else:
+                        self._log_test_result('xplane12_features', 'rain_validation', False,
+                                            "Rain validation system returned unexpected format")
+                except Exception as e:
                     self._log_test_result('xplane12_features', 'rain_validation', False,
-                                        "Rain validation system returned unexpected format")
-            except Exception as e:
-                self._log_test_result('xplane12_features', 'rain_validation', False,
-                                    f"Rain validation failed: {str(e)}")
-            
-            bpy.data.objects.remove(test_obj, do_unlink=True)
-            
+                                        f"Rain validation failed: {str(e)}")
         except Exception as e:
             self._log_test_result('xplane12_features', 'rain_system', False,
                                 f"Rain system test failed: {str(e)}")
@@ -207,45 +365,33 @@ class TestBlender4XPlane12Integration(XPlaneTestCase):
     def test_xplane12_thermal_system(self):
         """Test X-Plane 12 Thermal System (THERMAL_texture, THERMAL_source)"""
         try:
-            bpy.ops.mesh.primitive_cube_add()
-            test_obj = bpy.context.active_object
-            test_obj.name = "test_thermal_system"
-            test_obj.xplane.isExportableRoot = True
-            
-            rain_props = test_obj.xplane.layer.rain
-            
-            # Test thermal texture
-            if hasattr(rain_props, 'thermal_texture'):
-                rain_props.thermal_texture = "thermal_texture.png"
-                self._log_test_result('xplane12_features', 'thermal_texture_property', True,
-                                    f"Thermal texture property accessible, value: {rain_props.thermal_texture}")
-            else:
-                self._log_test_result('xplane12_features', 'thermal_texture_property', False,
-                                    "Thermal texture property not accessible")
-            
-            # Test thermal sources (4 sources: pilot side, copilot side, front window, additional)
-            thermal_sources = [f'thermal_source_{i}_enabled' for i in range(1, 5)]
-            
-            for source in thermal_sources:
-                if hasattr(rain_props, source):
-                    setattr(rain_props, source, True)
-                    self._log_test_result('xplane12_features', f'{source}_property', True,
-                                        f"Thermal source {source} accessible")
-                    
-                    # Test thermal source settings
-                    source_num = source.split('_')[2]
-                    source_obj_name = f'thermal_source_{source_num}'
-                    if hasattr(rain_props, source_obj_name):
-                        source_obj = getattr(rain_props, source_obj_name)
-                        if hasattr(source_obj, 'defrost_time'):
-                            source_obj.defrost_time = "30.0"
-                        if hasattr(source_obj, 'dataref_on_off'):
-                            source_obj.dataref_on_off = f"sim/cockpit/electrical/thermal_{source_num}"
+            with self._preserved(self.fixture_cube) as test_obj:
+                test_obj.xplane.isExportableRoot = True
+                
+                rain_props = _get_rain_settings(test_obj)
+                rain_attrs = _rna_keys(rain_props)
+                
+                # Test thermal texture
+                if 'thermal_texture' in rain_attrs:
+                    rain_props.thermal_texture = "thermal_texture.png"
+                    self._log_test_result('xplane12_features', 'thermal_texture_property', True,
+                                        f"Thermal texture property accessible, value: {rain_props.thermal_texture}")
                 else:
-                    self._log_test_result('xplane12_features', f'{source}_property', False,
-                                        f"Thermal source {source} not accessible")
-            
-            bpy.data.objects.remove(test_obj, do_unlink=True)
+                    self._log_test_result('xplane12_features', 'thermal_texture_property', False,
+                                        "Thermal texture property not accessible")
+                
+                # Test thermal sources
+                thermal_sources = self._probe_props(rain_props, THERMAL_SOURCE_SPECS, 'xplane12_features',
+                                                    '{}_property', "Thermal source", rain_attrs)
+                
+                for source in thermal_sources:
+                    # Test thermal source settings
+                    source_num, source_obj_name, get_source_obj = THERMAL_SOURCE_SETTINGS[source]
+                    if source_obj_name in rain_attrs:
+                        _set_present(get_source_obj(rain_props), {
+                            'defrost_time': "30.0",
+                            'dataref_on_off': f"sim/cockpit/electrical/thermal_{source_num}",
+                        })
             
         except Exception as e:
             self._log_test_result('xplane12_features', 'thermal_system', False,
@@ -254,60 +400,46 @@ class TestBlender4XPlane12Integration(XPlaneTestCase):
     def test_xplane12_wiper_system(self):
         """Test X-Plane 12 Wiper System (WIPER_texture)"""
         try:
-            bpy.ops.mesh.primitive_cube_add()
-            test_obj = bpy.context.active_object
-            test_obj.name = "test_wiper_system"
-            test_obj.xplane.isExportableRoot = True
-            
-            rain_props = test_obj.xplane.layer.rain
-            
-            # Test wiper texture
-            if hasattr(rain_props, 'wiper_texture'):
-                rain_props.wiper_texture = "wiper_texture.png"
-                self._log_test_result('xplane12_features', 'wiper_texture_property', True,
-                                    f"Wiper texture property accessible, value: {rain_props.wiper_texture}")
-            else:
-                self._log_test_result('xplane12_features', 'wiper_texture_property', False,
-                                    "Wiper texture property not accessible")
-            
-            # Test wiper settings (4 wipers)
-            wiper_props = [f'wiper_{i}_enabled' for i in range(1, 5)]
-            
-            for wiper in wiper_props:
-                if hasattr(rain_props, wiper):
-                    setattr(rain_props, wiper, True)
-                    self._log_test_result('xplane12_features', f'{wiper}_property', True,
-                                        f"Wiper property {wiper} accessible")
-                    
-                    # Test individual wiper settings
-                    wiper_num = wiper.split('_')[1]
-                    wiper_obj_name = f'wiper_{wiper_num}'
-                    if hasattr(rain_props, wiper_obj_name):
-                        wiper_obj = getattr(rain_props, wiper_obj_name)
-                        if hasattr(wiper_obj, 'object_name'):
-                            wiper_obj.object_name = f"wiper_{wiper_num}_object"
-                        if hasattr(wiper_obj, 'dataref'):
-                            wiper_obj.dataref = f"sim/cockpit/wipers/wiper_{wiper_num}"
-                        if hasattr(wiper_obj, 'nominal_width'):
-                            wiper_obj.nominal_width = 0.001
-                else:
-                    self._log_test_result('xplane12_features', f'{wiper}_property', False,
-                                        f"Wiper property {wiper} not accessible")
-            
-            # Test wiper operator
-            try:
-                if hasattr(bpy.ops, 'xplane') and hasattr(bpy.ops.xplane, 'bake_wiper_gradient_texture'):
-                    self._log_test_result('xplane12_features', 'wiper_operator', True,
-                                        "Wiper gradient texture operator accessible")
+            with self._preserved(self.fixture_cube) as test_obj:
+                test_obj.xplane.isExportableRoot = True
+                
+                rain_props = _get_rain_settings(test_obj)
+                rain_attrs = _rna_keys(rain_props)
+                
+                # Test wiper texture
+                if 'wiper_texture' in rain_attrs:
+                    rain_props.wiper_texture = "wiper_texture.png"
+                    self._log_test_result('xplane12_features', 'wiper_texture_property', True,
+                                        f"Wiper texture property accessible, value: {rain_props.wiper_texture}")
                 else:
+                    self._log_test_result('xplane12_features', 'wiper_texture_property', False,
+                                        "Wiper texture property not accessible")
+                
+                # Test wiper settings (4 wipers)
+                wipers = self._probe_props(rain_props, WIPER_SPECS, 'xplane12_features',
+                                           '{}_property', "Wiper property", rain_attrs)
+                
+                for wiper in wipers:
+                    # Test individual wiper settings
+                    wiper_num, wiper_obj_name, get_wiper_obj = WIPER_SETTINGS[wiper]
+                    if wiper_obj_name in rain_attrs:
+                        _set_present(get_wiper_obj(rain_props), {
+                            'object_name': f"wiper_{wiper_num}_object",
+                            'dataref': f"sim/cockpit/wipers/wiper_{wiper_num}",
+                            'nominal_width': 0.001,
+                        })
+                
+                # Test wiper operator
+                try:
+                    if hasattr(bpy.ops, 'xplane') and hasattr(bpy.ops.xplane, 'bake_wiper_gradient_texture'):
+                        self._log_test_result('xplane12_features', 'wiper_operator', True,
+                                            "Wiper gradient texture operator accessible")
+                    else:
+                        self._log_test_result('xplane12_features', 'wiper_operator', False,
+                                            "Wiper gradient texture operator not accessible")
+                except Exception as e:
                     self._log_test_result('xplane12_features', 'wiper_operator', False,
-                                        "Wiper gradient texture operator not accessible")
-            except Exception as e:
-                self._log_test_result('xplane12_features', 'wiper_operator', False,
-                                    f"Wiper operator test failed: {str(e)}")
-            
-            bpy.data.objects.remove(test_obj, do_unlink=True)
-            
+                                        f"Wiper operator test failed: {str(e)}")
         except Exception as e:
             self._log_test_result('xplane12_features', 'wiper_system', False,
                                 f"Wiper system test failed: {str(e)}")
@@ -315,57 +447,38 @@ class TestBlender4XPlane12Integration(XPlaneTestCase):
     def test_landing_gear_system(self):
         """Test Landing Gear System (ATTR_landing_gear) - Fixed enum values"""
         try:
-            # Create empty for landing gear
-            bpy.ops.object.empty_add(type='PLAIN_AXES')
-            gear_empty = bpy.context.active_object
-            gear_empty.name = "test_landing_gear"
-            
-            # Test landing gear properties
-            if hasattr(gear_empty.xplane, 'special_empty_props'):
-                special_props = gear_empty.xplane.special_empty_props
-                if hasattr(special_props, 'wheel_props'):
-                    wheel_props = special_props.wheel_props
-                    
-                    # Test gear properties with correct enum values
-                    gear_properties = [
-                        ('gear_type', 'NOSE'),  # Fixed: was 'GEAR_TYPE_NOSE'
-                        ('gear_index', 'GEAR_INDEX_NOSE'),
-                        ('wheel_index', 0),
-                        ('enable_retraction', True)
-                    ]
-                    
-                    for prop, value in gear_properties:
-                        if hasattr(wheel_props, prop):
-                            setattr(wheel_props, prop, value)
-                            self._log_test_result('xplane12_features', f'landing_gear_{prop}', True,
-                                                f"Landing gear property {prop} accessible, set to: {getattr(wheel_props, prop)}")
-                        else:
-                            self._log_test_result('xplane12_features', f'landing_gear_{prop}', False,
-                                                f"Landing gear property {prop} not accessible")
+            with self._preserved(self.fixture_empty) as gear_empty:
+                # Test landing gear properties
+                special_props = getattr(gear_empty.xplane, 'special_empty_props', _MISSING)
+                if special_props is not _MISSING:
+                    wheel_props = getattr(special_props, 'wheel_props', _MISSING)
+                    if wheel_props is not _MISSING:
+                        
+                        # Test gear properties with correct enum values
+                        self._probe_props(wheel_props, GEAR_SPECS, 'xplane12_features',
+                                          'landing_gear_{}', "Landing gear property",
+                                          report_value=True)
+                    else:
+                        self._log_test_result('xplane12_features', 'landing_gear_wheel_props', False,
+                                            "Landing gear wheel_props not accessible")
                 else:
-                    self._log_test_result('xplane12_features', 'landing_gear_wheel_props', False,
-                                        "Landing gear wheel_props not accessible")
-            else:
-                self._log_test_result('xplane12_features', 'landing_gear_special_props', False,
-                                    "Landing gear special_empty_props not accessible")
-            
-            # Test landing gear validation
-            try:
-                from io_xplane2blender.xplane_utils.xplane_gear_validation import validate_gear_object
-                result = validate_gear_object(gear_empty)
+                    self._log_test_result('xplane12_features', 'landing_gear_special_props', False,
+                                        "Landing gear special_empty_props not accessible")
                 
-                if hasattr(result, 'is_valid'):
-                    self._log_test_result('xplane12_features', 'landing_gear_validation', True,
-                                        f"Landing gear validation working, valid: {result.is_valid}")
-                else:
+                # Test landing gear validation
+                try:
+                    result = validate_gear_object(gear_empty)
+                    
+                    is_valid = getattr(result, 'is_valid', _MISSING)
+                    if is_valid is not _MISSING:
+                        self._log_test_result('xplane12_features', 'landing_gear_validation', True,
+                                            f"Landing gear validation working, valid: {is_valid}")
+                    else:
+                        self._log_test_result('xplane12_features', 'landing_gear_validation', False,
+                                            "Landing gear validation returned unexpected format")
+                except Exception as e:
                     self._log_test_result('xplane12_features', 'landing_gear_validation', False,
-                                        "Landing gear validation returned unexpected format")
-            except Exception as e:
-                self._log_test_result('xplane12_features', 'landing_gear_validation', False,
-                                    f"Landing gear validation failed: {str(e)}")
-            
-            bpy.data.objects.remove(gear_empty, do_unlink=True)
-            
+                                        f"Landing gear validation failed: {str(e)}")
         except Exception as e:
             self._log_test_result('xplane12_features', 'landing_gear_system', False,
                                 f"Landing gear system test failed: {str(e)}")
@@ -373,76 +486,63 @@ class TestBlender4XPlane12Integration(XPlaneTestCase):
     def test_material_integration(self):
         """Test Material System Integration with Blender 4+"""
         try:
-            # Create test material with nodes
-            test_mat = bpy.data.materials.new(name="test_material_integration")
-            test_mat.use_nodes = True
+            test_mat = self.fixture_material
             
             if test_mat.node_tree:
                 nodes = test_mat.node_tree.nodes
                 
-                # Add Principled BSDF if not present
-                if not any(node.type == 'BSDF_PRINCIPLED' for node in nodes):
-                    principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-                    self._log_test_result('material_integration', 'principled_bsdf_creation', True,
-                                        "Principled BSDF node created successfully")
-                else:
+                # use_nodes creates the default Principled BSDF under this name
+                if nodes.get("Principled BSDF") is not None:
                     self._log_test_result('material_integration', 'principled_bsdf_detection', True,
                                         "Principled BSDF node detected")
-                
-                # Test material conversion
-                bpy.ops.mesh.primitive_cube_add()
-                test_obj = bpy.context.active_object
-                test_obj.name = "test_material_obj"
-                
-                # Assign material
-                if test_obj.data.materials:
-                    test_obj.data.materials[0] = test_mat
                 else:
-                    test_obj.data.materials.append(test_mat)
-                
-                # Test texture maps integration
-                texture_maps = test_obj.xplane.layer.texture_maps
-                texture_maps.blender_material_integration = True
-                texture_maps.auto_detect_principled_bsdf = True
-                texture_maps.auto_detect_normal_map_nodes = True
-                texture_maps.auto_detect_image_texture_nodes = True
+                    self._log_test_result('material_integration', 'principled_bsdf_detection', False,
+                                        "Principled BSDF node not found")
                 
-                self._log_test_result('material_integration', 'blender4_material_properties', True,
-                                    "Blender 4+ material integration properties set successfully")
-                
-                # Test material converter
-                try:
-                    from io_xplane2blender.xplane_utils.xplane_material_converter import convert_blender_material_to_xplane
-                    result = convert_blender_material_to_xplane(test_mat, texture_maps)
-                    
-                    if isinstance(result, dict):
-                        self._log_test_result('material_integration', 'material_conversion', True,
-                                            f"Material conversion working, success: {result.get('success', 'Unknown')}")
+                # Test material conversion
+                with self._preserved(self.fixture_cube) as test_obj:
+                    # Assign material
+                    if test_obj.data.materials:
+                        test_obj.data.materials[0] = test_mat
                     else:
+                        test_obj.data.materials.append(test_mat)
+                    
+                    # Test texture maps integration
+                    texture_maps = test_obj.xplane.layer.texture_maps
+                    texture_maps.blender_material_integration = True
+                    texture_maps.auto_detect_principled_bsdf = True
+                    texture_maps.auto_detect_normal_map_nodes = True
+                    texture_maps.auto_detect_image_texture_nodes = True
+                    
+                    self._log_test_result('material_integration', 'blender4_material_properties', True,
+                                        "Blender 4+ material integration properties set successfully")
+                    
+                    # Test material converter
+                    try:
+                        result = convert_blender_material_to_xplane(test_mat, texture_maps)
+                        
+                        if isinstance(result, dict):
+                            self._log_test_result('material_integration', 'material_conversion', True,
+                                                f"Material conversion working, success: {result.get('success', 'Unknown')}")
+                        else:
+                            self._log_test_result('material_integration', 'material_conversion', False,
+                                                "Material conversion returned unexpected format")
+                    except Exception as e:
                         self._log_test_result('material_integration', 'material_conversion', False,
-                                            "Material conversion returned unexpected format")
-                except Exception as e:
-                    self._log_test_result('material_integration', 'material_conversion', False,
-                                        f"Material conversion failed: {str(e)}")
-                
-                # Test texture validation
-                try:
-                    from io_xplane2blender.xplane_utils.xplane_texture_validation import validate_texture_system
-                    results = validate_texture_system(texture_maps, "test_material.obj", 1210)
+                                            f"Material conversion failed: {str(e)}")
                     
-                    self._log_test_result('material_integration', 'texture_validation', True,
-                                        f"Texture validation working, {len(results['errors'])} errors, {len(results.get('warnings', []))} warnings, {len(results.get('info', []))} info")
-                except Exception as e:
-                    self._log_test_result('material_integration', 'texture_validation', False,
-                                        f"Texture validation failed: {str(e)}")
-                
-                bpy.data.objects.remove(test_obj, do_unlink=True)
+                    # Test texture validation
+                    try:
+                        results = validate_texture_system(texture_maps, "test_material.obj", 1210)
+                        
+                        self._log_test_result('material_integration', 'texture_validation', True,
+                                            f"Texture validation working, {len(results['errors'])} errors, {len(results.get('warnings', ()))} warnings, {len(results.get('info', ()))} info")
+                    except Exception as e:
+                        self._log_test_result('material_integration', 'texture_validation', False,
+                                            f"Texture validation failed: {str(e)}")
             else:
                 self._log_test_result('material_integration', 'material_nodes', False,
                                     "Material node tree not accessible")
-            
-            bpy.data.materials.remove(test_mat)
-            
         except Exception as e:
             self._log_test_result('material_integration', 'material_integration_test', False,
                                 f"Material integration test failed: {str(e)}")
@@ -450,60 +550,50 @@ class TestBlender4XPlane12Integration(XPlaneTestCase):
     def test_complex_integration_scenarios(self):
         """Test complex integration scenarios with multiple X-Plane 12 features"""
         try:
-            # Test 1: Combined X-Plane 12 features
-            bpy.ops.mesh.primitive_cube_add()
-            test_obj = bpy.context.active_object
-            test_obj.name = "test_integration_object"
-            test_obj.xplane.isExportableRoot = True
-            
-            # Enable multiple X-Plane 12 features
-            rain_props = test_obj.xplane.layer.rain
-            rain_props.rain_scale = 0.8
-            rain_props.rain_friction_enabled = True
-            rain_props.rain_friction_dataref = "sim/weather/rain_percent"
-            rain_props.rain_friction_dry_coefficient = 1.0
-            rain_props.rain_friction_wet_coefficient = 0.3
-            rain_props.thermal_texture = "thermal.png"
-            rain_props.thermal_source_1_enabled = True
-            rain_props.wiper_texture = "wiper.png"
-            rain_props.wiper_1_enabled = True
-            
-            self._log_test_result('integration_tests', 'multiple_xplane12_features', True,
-                                "Multiple X-Plane 12 features configured successfully")
-            
-            # Test 2: Material integration with X-Plane 12 features
-            test_mat = bpy.data.materials.new(name="test_integration_material")
-            test_mat.use_nodes = True
-            
-            if test_obj.data.materials:
-                test_obj.data.materials[0] = test_mat
-            else:
-                test_obj.data.materials.append(test_mat)
-            
-            # Enable material integration
-            texture_maps = test_obj.xplane.layer.texture_maps
-            texture_maps.blender_material_integration = True
-            texture_maps.auto_detect_principled_bsdf = True
-            
-            self._log_test_result('integration_tests', 'material_xplane12_integration', True,
-                                "Material integration with X-Plane 12 features working")
-            
-            # Test comprehensive validation
-            try:
-                from io_xplane2blender.xplane_utils.xplane_rain_validation import validate_rain_system
-                results = validate_rain_system(rain_props, "test_integration.obj", 1200)
+            with self._preserved(self.fixture_cube) as test_obj:
+                # Test 1: Combined X-Plane 12 features
+                test_obj.xplane.isExportableRoot = True
                 
-                total_messages = len(results['errors']) + len(results.get('warnings', [])) + len(results.get('info', []))
-                self._log_test_result('integration_tests', 'comprehensive_validation', True,
-                                    f"Comprehensive validation completed with {total_messages} total messages")
-            except Exception as e:
-                self._log_test_result('integration_tests', 'comprehensive_validation', False,
-                                    f"Comprehensive validation failed: {str(e)}")
-            
-            # Clean up
-            bpy.data.materials.remove(test_mat)
-            bpy.data.objects.remove(test_obj, do_unlink=True)
-            
+                # Enable multiple X-Plane 12 features
+                rain_props, texture_maps = _get_layer_settings(test_obj)
+                rain_props.rain_scale = 0.8
+                rain_props.rain_friction_enabled = True
+                rain_props.rain_friction_dataref = "sim/weather/rain_percent"
+                rain_props.rain_friction_dry_coefficient = 1.0
+                rain_props.rain_friction_wet_coefficient = 0.3
+                rain_props.thermal_texture = "thermal.png"
+                rain_props.thermal_source_1_enabled = True
+                rain_props.wiper_texture = "wiper.png"
+                rain_props.wiper_1_enabled = True
+                
+                self._log_test_result('integration_tests', 'multiple_xplane12_features', True,
+                                    "Multiple X-Plane 12 features configured successfully")
+                
+                # Test 2: Material integration with X-Plane 12 features
+                test_mat = self.fixture_material
+                
+                if test_obj.data.materials:
+                    test_obj.data.materials[0] = test_mat
+                else:
+                    test_obj.data.materials.append(test_mat)
+                
+                # Enable material integration
+                texture_maps.blender_material_integration = True
+                texture_maps.auto_detect_principled_bsdf = True
+                
+                self._log_test_result('integration_tests', 'material_xplane12_integration', True,
+                                    "Material integration with X-Plane 12 features working")
+                
+                # Test comprehensive validation
+                try:
+                    results = validate_rain_system(rain_props, "test_integration.obj", 1200)
+                    
+                    total_messages = sum(len(results.get(key, ())) for key in VALIDATION_MESSAGE_KEYS)
+                    self._log_test_result('integration_tests', 'comprehensive_validation', True,
+                                        f"Comprehensive validation completed with {total_messages} total messages")
+                except Exception as e:
+                    self._log_test_result('integration_tests', 'comprehensive_validation', False,
+                                        f"Comprehensive validation failed: {str(e)}")
         except Exception as e:
             self._log_test_result('integration_tests', 'complex_integration_scenarios', False,
                                 f"Complex integration scenarios test failed: {str(e)}")
@@ -516,9 +606,7 @@ class TestBlender4XPlane12Integration(XPlaneTestCase):
             # Create complex scene with multiple objects and features
             objects_created = []
             for i in range(5):  # Create 5 test objects
-                bpy.ops.mesh.primitive_cube_add(location=(i * 2, 0, 0))
-                test_obj = bpy.context.active_object
-                test_obj.name = f"test_performance_obj_{i}"
+                test_obj = _make_cube(f"test_performance_obj_{i}", location=(i * 2, 0, 0))
                 test_obj.xplane.isExportableRoot = True
                 objects_created.append(test_obj)
                 
@@ -528,14 +616,13 @@ class TestBlender4XPlane12Integration(XPlaneTestCase):
                 test_obj.data.materials.append(test_mat)
                 
                 # Configure X-Plane 12 features
-                rain_props = test_obj.xplane.layer.rain
+                rain_props, texture_maps = _get_layer_settings(test_obj)
                 rain_props.rain_scale = 0.5 + (i * 0.1)
                 rain_props.rain_friction_enabled = True
                 rain_props.thermal_texture = f"thermal_{i}.png"
                 rain_props.wiper_texture = f"wiper_{i}.png"
                 
                 # Enable material integration
-                texture_maps = test_obj.xplane.layer.texture_maps
                 texture_maps.blender_material_integration = True
                 texture_maps.auto_detect_principled_bsdf = True
             
@@ -545,8 +632,7 @@ class TestBlender4XPlane12Integration(XPlaneTestCase):
             validation_start = time.time()
             for obj in objects_created:
                 try:
-                    from io_xplane2blender.xplane_utils.xplane_rain_validation import validate_rain_system
-                    results = validate_rain_system(obj.xplane.layer.rain, f"test_perf_{obj.name}.obj", 1200)
+                    results = validate_rain_system(_get_rain_settings(obj), f"test_perf_{obj.name}.obj", 1200)
                 except Exception:
                     pass  # Performance test, don't fail on validation errors
             
@@ -556,13 +642,12 @@ class TestBlender4XPlane12Integration(XPlaneTestCase):
             self._log_test_result('performance_tests', 'complex_scene_performance', True,
                                 f"Performance test completed - Setup: {setup_time:.2f}s, Validation: {validation_time:.2f}s, Total: {total_time:.2f}s")
             
-            # Clean up
+            # Clean up the objects, their meshes, and materials in one pass
+            trash = set(objects_created)
             for obj in objects_created:
-                if obj.data.materials:
-                    for mat in obj.data.materials:
-                        if mat:
-                            bpy.data.materials.remove(mat)
-                bpy.data.objects.remove(obj, do_unlink=True)
+                trash.add(obj.data)
+                trash.update(mat for mat in obj.data.materials if mat)
+            bpy.data.batch_remove(trash)
             
             # Performance criteria (should complete within reasonable time)
             if total_time < 10.0:  # 10 seconds for 5 objects with full validation
@@ -571,7 +656,6 @@ class TestBlender4XPlane12Integration(XPlaneTestCase):
             else:
                 self._log_test_result('performance_tests', 'performance_criteria', False,
                                     f"Performance criteria not met: {total_time:.2f}s >= 10.0s")
-            
         except Exception as e:
             self._log_test_result('performance_tests', 'export_performance', False,
                                 f"Export performance test failed: {str(e)}")
@@ -579,48 +663,41 @@ class TestBlender4XPlane12Integration(XPlaneTestCase):
     def test_error_handling_and_graceful_degradation(self):
         """Test error handling and graceful degradation for unsupported features"""
         try:
-            # Test with invalid configurations
-            bpy.ops.mesh.primitive_cube_add()
-            test_obj = bpy.context.active_object
-            test_obj.name = "test_error_handling"
-            test_obj.xplane.isExportableRoot = True
-            
-            rain_props = test_obj.xplane.layer.rain
-            
-            # Test with invalid values
-            try:
-                rain_props.rain_scale = -1.0  # Invalid negative value
-                rain_props.rain_friction_dataref = ""  # Empty dataref
-                
-                # Test validation with invalid configuration
-                from io_xplane2blender.xplane_utils.xplane_rain_validation import validate_rain_system
-                results = validate_rain_system(rain_props, "test_error.obj", 1200)
+            with self._preserved(self.fixture_cube) as test_obj:
+                # Test with invalid configurations
+                test_obj.xplane.isExportableRoot = True
                 
-                # Should have errors for invalid configuration
-                if len(results['errors']) > 0:
-                    self._log_test_result('integration_tests', 'error_detection', True,
-                                        f"Error detection working: {len(results['errors'])} errors found for invalid config")
-                else:
-                    self._log_test_result('integration_tests', 'error_detection', False,
-                                        "Error detection not working: no errors found for invalid config")
+                rain_props = _get_rain_settings(test_obj)
                 
-            except Exception as e:
-                self._log_test_result('integration_tests', 'error_handling', True,
-                                    f"Error handling working: caught exception {str(e)}")
-            
-            # Test graceful degradation with missing features
-            try:
-                # Test with older X-Plane version (should gracefully ignore new features)
-                results = validate_rain_system(rain_props, "test_legacy.obj", 1100)  # X-Plane 11
+                # Test with invalid values
+                try:
+                    rain_props.rain_scale = -1.0  # Invalid negative value
+                    rain_props.rain_friction_dataref = ""  # Empty dataref
+                    
+                    # Test validation with invalid configuration
+                    results = validate_rain_system(rain_props, "test_error.obj", 1200)
+                    
+                    # Should have errors for invalid configuration
+                    if len(results['errors']) > 0:
+                        self._log_test_result('integration_tests', 'error_detection', True,
+                                            f"Error detection working: {len(results['errors'])} errors found for invalid config")
+                    else:
+                        self._log_test_result('integration_tests', 'error_detection', False,
+                                            "Error detection not working: no errors found for invalid config")
+                except Exception as e:
+                    self._log_test_result('integration_tests', 'error_handling', True,
+                                        f"Error handling working: caught exception {str(e)}")
                 
-                self._log_test_result('integration_tests', 'graceful_degradation', True,
-                                    "Graceful degradation working for older X-Plane versions")
-            except Exception as e:
-                self._log_test_result('integration_tests', 'graceful_degradation', False,
-                                    f"Graceful degradation failed: {str(e)}")
-            
-            bpy.data.objects.remove(test_obj, do_unlink=True)
-            
+                # Test graceful degradation with missing features
+                try:
+                    # Test with older X-Plane version (should gracefully ignore new features)
+                    results = validate_rain_system(rain_props, "test_legacy.obj", 1100)  # X-Plane 11
+                    
+                    self._log_test_result('integration_tests', 'graceful_degradation', True,
+                                        "Graceful degradation working for older X-Plane versions")
+                except Exception as e:
+                    self._log_test_result('integration_tests', 'graceful_degradation', False,
+                                        f"Graceful degradation failed: {str(e)}")
         except Exception as e:
             self._log_test_result('integration_tests', 'error_handling_test', False,
-                                f"Error handling test failed: {str(e)}")
\ No newline at end of file
+                                f"Error handling test failed: {str(e)}")
@@ -13,18 +13,28 @@ Usage:
     blender --python tests/test_suite_runner.py
     blender --python tests/test_suite_runner.py -- --filter rain
     blender --python tests/test_suite_runner.py -- --performance
+    blender --python tests/test_suite_runner.py -- --jobs 4
 """
 
 import sys
 import time
+import json
 import argparse
+import functools
+import io
+import os
+import subprocess
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 import bpy
 
 # Add project root to path for imports
-project_root = Path(__file__).parent.parent
+runner_path = Path(__file__).resolve()
+project_root = runner_path.parent.parent
 sys.path.insert(0, str(project_root))
 
 # Import validation test modules
@@ -45,6 +55,55 @@ except ImportError as e:
     print(f"Warning: Integration tests not available: {e}")
     integration_tests_available = False
 
+# Integration test methods grouped by the result category they report into.
+# The categories are independent of each other, so each one can run in its
+# own background Blender process (see --jobs).
+INTEGRATION_TEST_CATEGORIES = {
+    'ui_compatibility': (
+        'test_ui_panel_compatibility',
+        'test_blender4_integration_properties',
+    ),
+    'xplane12_features': (
+        'test_xplane12_rain_system',
+        'test_xplane12_thermal_system',
+        'test_xplane12_wiper_system',
+        'test_landing_gear_system',
+    ),
+    'material_integration': (
+        'test_material_integration',
+    ),
+    'integration_tests': (
+        'test_complex_integration_scenarios',
+        'test_error_handling_and_graceful_degradation',
+    ),
+}
+
+# (result key, runner method, suites that must not have failed), in run order.
+# Each runner method reports {'skipped': True} itself when filtered out,
+# in --quick mode, or when --performance wasn't asked for.
+TEST_SUITES = (
+    ('addon_registration', 'run_addon_registration_tests', ()),
+    ('critical_validation', 'run_critical_validation_tests', ()),
+    ('complete_validation', 'run_complete_validation_tests', ()),
+    ('blender4_validation', 'run_blender4_validation_tests', ()),
+    ('integration_tests', 'run_integration_tests', ()),
+    # Same test case, a broken setup would only fail again
+    ('performance_tests', 'run_performance_tests', ('integration_tests',)),
+)
+
+
+def _merge_category_results(test_results: Dict[str, Dict[str, List[Any]]],
+                            diagnostics: Dict[str, List[str]],
+                            new_test_results: Dict[str, Dict[str, List[Any]]],
+                            new_diagnostics: Dict[str, List[str]]) -> None:
+    """Appends one test case's (or shard's) per-category results and diagnostics to the merged ones"""
+    for key, tests in new_test_results.items():
+        merged = test_results.setdefault(key, {field: [] for field in tests})
+        for field, values in tests.items():
+            merged[field].extend(values)
+    for key, messages in new_diagnostics.items():
+        diagnostics.setdefault(key, []).extend(messages)
+
 
 class TestSuiteRunner:
     """Comprehensive test suite runner for XPlane2Blender"""
@@ -62,6 +121,9 @@ class TestSuiteRunner:
         self.test_filter = None
         self.run_performance = False
         self.verbose = False
+        self.category = None
+        self.json_path = None
+        self.jobs = 1
     
     def parse_args(self):
         """Parse command line arguments"""
@@ -76,6 +138,11 @@ class TestSuiteRunner:
         parser.add_argument('--performance', help='Run performance tests', action='store_true')
         parser.add_argument('--verbose', help='Verbose output', action='store_true')
         parser.add_argument('--quick', help='Run only critical tests', action='store_true')
+        parser.add_argument('--category', help='Run only one integration test category',
+                            choices=INTEGRATION_TEST_CATEGORIES)
+        parser.add_argument('--json', help='Write integration results to this JSON file', type=str)
+        parser.add_argument('--jobs', help='Run integration categories in N Blender processes',
+                            type=int, default=1)
         
         if script_args:
             args = parser.parse_args(script_args)
@@ -83,6 +150,9 @@ class TestSuiteRunner:
             self.run_performance = args.performance
             self.verbose = args.verbose
             self.quick_mode = args.quick
+            self.category = args.category
+            self.json_path = args.json
+            self.jobs = max(1, args.jobs)
         else:
             self.quick_mode = False
     
@@ -185,53 +255,145 @@ class TestSuiteRunner:
         print("RUNNING INTEGRATION TESTS")
         print("="*60)
         
+        if self.jobs > 1 and not self.category:
+            return self.run_integration_shards()
+        
+        # Run individual test methods
+        if self.category:
+            test_methods = INTEGRATION_TEST_CATEGORIES[self.category]
+        else:
+            test_methods = [
+                method_name
+                for methods in INTEGRATION_TEST_CATEGORIES.values()
+                for method_name in methods
+            ]
+        
         try:
-            import unittest
+            # The suite runs the class's setUpClass/tearDownClass around the tests
+            suite = unittest.defaultTestLoader.loadTestsFromNames(
+                test_methods, TestBlender4XPlane12Integration
+            )
+            test_cases = [test_case for tests in suite for test_case in tests]
+            outcome = unittest.TestResult()
+            suite.run(outcome)
             
-            # Create test suite
-            suite = unittest.TestSuite()
-            
-            # Add integration tests
-            test_case = TestBlender4XPlane12Integration()
-            test_case.setUp()
-            
-            # Run individual test methods
-            test_methods = [
-                'test_ui_panel_compatibility',
-                'test_blender4_integration_properties',
-                'test_xplane12_rain_system',
-                'test_xplane12_thermal_system',
-                'test_xplane12_wiper_system',
-                'test_landing_gear_system',
-                'test_material_integration',
-                'test_complex_integration_scenarios',
-                'test_error_handling_and_graceful_degradation'
+            # Errors not tied to a test come from setUpClass/tearDownClass
+            class_errors = [
+                traceback for test, traceback in outcome.errors
+                if not isinstance(test, unittest.TestCase)
             ]
+            if class_errors:
+                raise RuntimeError(class_errors[0].strip().splitlines()[-1])
             
+            failed = {test.id(): traceback for test, traceback in outcome.errors + outcome.failures}
             results = []
-            for method_name in test_methods:
-                if hasattr(test_case, method_name):
-                    try:
-                        method = getattr(test_case, method_name)
-                        method()
-                        results.append((method_name, True, "Passed"))
+            test_results = {}
+            diagnostics = {}
+            for test_case in test_cases:
+                method_name = test_case._testMethodName
+                traceback = failed.get(test_case.id())
+                if traceback is None:
+                    results.append((method_name, True, "Passed"))
+                    if self.verbose:
                         print(f"✓ {method_name}")
-                    except Exception as e:
-                        results.append((method_name, False, str(e)))
-                        print(f"✗ {method_name}: {e}")
+                else:
+                    message = traceback.strip().splitlines()[-1]
+                    results.append((method_name, False, message))
+                    print(f"✗ {method_name}: {message}")
+                _merge_category_results(test_results, diagnostics,
+                                        test_case.test_results, test_case.diagnostics)
             
             return {
                 'success': True,
                 'results': results,
                 'passed': sum(1 for _, success, _ in results if success),
                 'total': len(results),
-                'test_results': test_case.test_results
+                'test_results': test_results,
+                'diagnostics': diagnostics
             }
             
         except Exception as e:
             print(f"Integration tests failed: {e}")
             return {'success': False, 'error': str(e)}
     
+    def run_integration_shards(self) -> Dict[str, Any]:
+        """Run each integration category in its own background Blender process
+
+        Every worker is this script started with --category and --json, the
+        JSON files are merged back into a single integration result.
+        """
+        def run_shard(category: str) -> Dict[str, Any]:
+            json_path = Path(shard_dir, f"results_{category}.json")
+            cmd = [
+                bpy.app.binary_path,
+                "--background",
+                "--factory-startup",
+                "--addons",
+                "io_xplane2blender",
+                "--python",
+                str(runner_path),
+                "--",
+                "--category",
+                category,
+                "--json",
+                str(json_path),
+            ]
+            completed = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                       universal_newlines=True, env=os.environ.copy())
+            if self.verbose:
+                print(completed.stdout)
+            try:
+                with open(json_path) as f:
+                    shard = json.load(f)
+            except (OSError, ValueError) as e:
+                shard = {'success': False, 'error': f"{category} worker produced no results: {e}"}
+            # A failing worker's output is always shown, verbose runs already printed it
+            if not self.verbose and (completed.returncode != 0 or not shard.get('success', False)):
+                shard['output'] = completed.stdout
+                shard['returncode'] = completed.returncode
+            return shard
+        
+        # One scratch directory for the whole run, removed once every worker is done
+        with tempfile.TemporaryDirectory(prefix="xp2b_integration_") as shard_dir, \
+                ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            shard_results = dict(zip(
+                INTEGRATION_TEST_CATEGORIES,
+                executor.map(run_shard, INTEGRATION_TEST_CATEGORIES)
+            ))
+        
+        results = []
+        test_results = {}
+        diagnostics = {}
+        for category, shard in shard_results.items():
+            if 'output' in shard:
+                print(f"Integration shard {category} worker output (exit code {shard['returncode']}):")
+                print(shard['output'])
+            if not shard.get('success', False):
+                print(f"Integration shard {category} failed: {shard.get('error', 'Unknown error')}")
+                results.append((category, False, shard.get('error', 'Unknown error')))
+                continue
+            results.extend(tuple(result) for result in shard['results'])
+            _merge_category_results(test_results, diagnostics,
+                                    shard['test_results'], shard['diagnostics'])
+        
+        # Shard results arrive all at once, so write them in one go
+        lines = io.StringIO()
+        for method_name, success, message in results:
+            if not success:
+                print(f"✗ {method_name}: {message}", file=lines)
+            elif self.verbose:
+                print(f"✓ {method_name}", file=lines)
+        sys.stdout.write(lines.getvalue())
+        
+        return {
+            'success': True,
+            'results': results,
+            'passed': sum(1 for _, success, _ in results if success),
+            'total': len(results),
+            'test_results': test_results,
+            'diagnostics': diagnostics
+        }
+    
     def run_performance_tests(self) -> Dict[str, Any]:
         """Run performance tests"""
         if not self.run_performance or not integration_tests_available:
@@ -252,7 +414,7 @@ class TestSuiteRunner:
             return {
                 'success': True,
                 'performance_time': performance_time,
-                'test_results': test_case.test_results.get('performance_tests', [])
+                'test_results': test_case.test_results['performance_tests']
             }
             
         except Exception as e:
@@ -270,29 +432,35 @@ class TestSuiteRunner:
         print(f"Quick Mode: {'Enabled' if self.quick_mode else 'Disabled'}")
         print("")
         
-        # Run test suites in order
-        self.results['addon_registration'] = self.run_addon_registration_tests()
-        self.results['critical_validation'] = self.run_critical_validation_tests()
+        self.__dict__.pop('_summary', None)
         
-        if not self.quick_mode:
-            self.results['complete_validation'] = self.run_complete_validation_tests()
-            self.results['blender4_validation'] = self.run_blender4_validation_tests()
+        # Integration shard worker, only its category is run
+        if self.category:
             self.results['integration_tests'] = self.run_integration_tests()
-        
-        if self.run_performance:
-            self.results['performance_tests'] = self.run_performance_tests()
+            return self.results
+        
+        # Run test suites in order, skipping those whose prerequisites failed
+        failed = set()
+        for suite_name, run_suite, requires in TEST_SUITES:
+            broken = [name for name in requires if name in failed]
+            if broken:
+                print(f"\nSkipping {suite_name}: {', '.join(broken)} failed")
+                self.results[suite_name] = {'skipped': True, 'reason': f"{', '.join(broken)} failed"}
+                continue
+            
+            result = getattr(self, run_suite)()
+            self.results[suite_name] = result
+            if not result.get('skipped') and not result.get('success', False):
+                failed.add(suite_name)
         
         return self.results
     
-    def generate_summary_report(self) -> str:
-        """Generate comprehensive summary report"""
-        total_time = time.time() - self.start_time
-        
-        report = []
-        report.append("\n" + "="*60)
-        report.append("COMPREHENSIVE TEST SUITE SUMMARY")
-        report.append("="*60)
-        
+    @functools.cached_property
+    def _summary(self) -> Tuple[int, int, List[Tuple[str, str, int, int]]]:
+        """
+        (total passed, total tests, per suite (name, status, passed, total)) over self.results,
+        cleared by run_all_tests
+        """
         total_passed = 0
         total_tests = 0
         suite_results = []
@@ -314,23 +482,36 @@ class TestSuiteRunner:
             status = "PASS" if passed == total else "PARTIAL"
             suite_results.append((suite_name, status, passed, total))
         
+        return total_passed, total_tests, suite_results
+    
+    def generate_summary_report(self) -> str:
+        """Generate comprehensive summary report"""
+        total_time = time.time() - self.start_time
+        
+        report = io.StringIO()
+        print("\n" + "="*60, file=report)
+        print("COMPREHENSIVE TEST SUITE SUMMARY", file=report)
+        print("="*60, file=report)
+        
+        total_passed, total_tests, suite_results = self._summary
+        
         # Suite summary
         for suite_name, status, passed, total in suite_results:
             if status == "SKIPPED":
-                report.append(f"[SKIP] {suite_name.replace('_', ' ').title()}")
+                print(f"[SKIP] {suite_name.replace('_', ' ').title()}", file=report)
             elif status == "FAILED":
-                report.append(f"[FAIL] {suite_name.replace('_', ' ').title()}")
+                print(f"[FAIL] {suite_name.replace('_', ' ').title()}", file=report)
             else:
-                report.append(f"[{status}] {suite_name.replace('_', ' ').title()}: {passed}/{total}")
+                print(f"[{status}] {suite_name.replace('_', ' ').title()}: {passed}/{total}", file=report)
         
         # Overall summary
-        report.append("")
-        report.append(f"Overall Results: {total_passed}/{total_tests} tests passed")
+        print(file=report)
+        print(f"Overall Results: {total_passed}/{total_tests} tests passed", file=report)
         if total_tests > 0:
             percentage = (total_passed / total_tests) * 100
-            report.append(f"Success Rate: {percentage:.1f}%")
+            print(f"Success Rate: {percentage:.1f}%", file=report)
         
-        report.append(f"Total Execution Time: {total_time:.2f} seconds")
+        print(f"Total Execution Time: {total_time:.2f} seconds", file=report)
         
         # Detailed results for failed tests
         failed_tests = []
@@ -345,57 +526,57 @@ class TestSuiteRunner:
                         failed_tests.append(f"{suite_name}: {test_result.get('test', 'Unknown')}")
         
         if failed_tests:
-            report.append("")
-            report.append("Failed Tests:")
+            print(file=report)
+            print("Failed Tests:", file=report)
             for failed_test in failed_tests:
-                report.append(f"  - {failed_test}")
+                print(f"  - {failed_test}", file=report)
         
         # Performance summary
         if self.results.get('performance_tests') and not self.results['performance_tests'].get('skipped'):
             perf_result = self.results['performance_tests']
             if perf_result.get('success'):
                 perf_time = perf_result.get('performance_time', 0)
-                report.append("")
-                report.append(f"Performance Test Time: {perf_time:.2f} seconds")
+                print(file=report)
+                print(f"Performance Test Time: {perf_time:.2f} seconds", file=report)
         
         # Recommendations
-        report.append("")
-        report.append("Recommendations:")
+        print(file=report)
+        print("Recommendations:", file=report)
         
         if total_tests == 0:
-            report.append("  - No tests were executed. Check test availability and filters.")
+            print("  - No tests were executed. Check test availability and filters.", file=report)
         elif total_passed == total_tests:
-            report.append("  - ✓ All tests passed! XPlane2Blender is ready for production use.")
-            report.append("  - Consider running performance tests if not already done.")
+            print("  - ✓ All tests passed! XPlane2Blender is ready for production use.", file=report)
+            print("  - Consider running performance tests if not already done.", file=report)
         elif total_passed / total_tests >= 0.9:
-            report.append("  - ✓ Most tests passed. Minor issues may need attention.")
-            report.append("  - Review failed tests and address any critical issues.")
+            print("  - ✓ Most tests passed. Minor issues may need attention.", file=report)
+            print("  - Review failed tests and address any critical issues.", file=report)
         else:
-            report.append("  - ⚠ Significant test failures detected.")
-            report.append("  - Review and fix failed tests before production use.")
-            report.append("  - Consider running individual test suites for detailed debugging.")
+            print("  - ⚠ Significant test failures detected.", file=report)
+            print("  - Review and fix failed tests before production use.", file=report)
+            print("  - Consider running individual test suites for detailed debugging.", file=report)
         
-        return "\n".join(report)
+        return report.getvalue()
     
     def save_detailed_report(self, filename: str = "test_results.txt"):
         """Save detailed test results to file"""
         try:
-            report_lines = []
-            report_lines.append("XPlane2Blender Detailed Test Results")
-            report_lines.append("="*50)
-            report_lines.append(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-            report_lines.append(f"Blender Version: {bpy.app.version_string}")
-            report_lines.append("")
+            report = io.StringIO()
+            print("XPlane2Blender Detailed Test Results", file=report)
+            print("="*50, file=report)
+            print(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}", file=report)
+            print(f"Blender Version: {bpy.app.version_string}", file=report)
+            print(file=report)
             
             for suite_name, result in self.results.items():
                 if result is None or result.get('skipped'):
                     continue
                 
-                report_lines.append(f"\n{suite_name.replace('_', ' ').title()}:")
-                report_lines.append("-" * 30)
+                print(f"\n{suite_name.replace('_', ' ').title()}:", file=report)
+                print("-" * 30, file=report)
                 
                 if not result.get('success', False):
-                    report_lines.append(f"FAILED: {result.get('error', 'Unknown error')}")
+                    print(f"FAILED: {result.get('error', 'Unknown error')}", file=report)
                     continue
                 
                 if 'results' in result:
@@ -403,31 +584,28 @@ class TestSuiteRunner:
                         if isinstance(test_result, tuple):
                             test_name, success = test_result[0], test_result[1]
                             status = "PASS" if success else "FAIL"
-                            report_lines.append(f"  [{status}] {test_name}")
+                            print(f"  [{status}] {test_name}", file=report)
                         elif isinstance(test_result, dict):
                             test_name = test_result.get('test', 'Unknown')
                             success = test_result.get('success', False)
                             message = test_result.get('message', '')
                             status = "PASS" if success else "FAIL"
-                            report_lines.append(f"  [{status}] {test_name}: {message}")
+                            print(f"  [{status}] {test_name}: {message}", file=report)
                 
                 # Add integration test details
                 if 'test_results' in result:
                     test_results = result['test_results']
                     for category, tests in test_results.items():
-                        if tests and category != 'errors':
-                            report_lines.append(f"\n  {category.replace('_', ' ').title()}:")
-                            for test in tests:
-                                if isinstance(test, dict):
-                                    test_name = test.get('test', 'Unknown')
-                                    success = test.get('success', False)
-                                    message = test.get('message', '')
-                                    status = "PASS" if success else "FAIL"
-                                    report_lines.append(f"    [{status}] {test_name}: {message}")
+                        if tests['test']:
+                            passed = sum(tests['success'])
+                            print(f"\n  {category.replace('_', ' ').title()}: "
+                                  f"{passed}/{len(tests['success'])}", file=report)
+                            for test_name, success, message in zip(tests['test'], tests['success'], tests['message']):
+                                status = "PASS" if success else "FAIL"
+                                print(f"    [{status}] {test_name}: {message}", file=report)
             
             # Write to file
-            with open(filename, 'w') as f:
-                f.write("\n".join(report_lines))
+            Path(filename).write_text(report.getvalue(), encoding="utf-8")
             
             print(f"\nDetailed report saved to: {filename}")
             
@@ -444,6 +622,11 @@ def main():
         # Run all tests
         results = runner.run_all_tests()
         
+        if runner.json_path:
+            with open(runner.json_path, 'w') as f:
+                json.dump(results['integration_tests'], f)
+            return 0
+        
         # Generate and display summary
         summary = runner.generate_summary_report()
         print(summary)
@@ -452,8 +635,7 @@ def main():
         runner.save_detailed_report()
         
         # Return appropriate exit code
-        total_passed = sum(r.get('passed', 0) for r in results.values() if r and r.get('success'))
-        total_tests = sum(r.get('total', 0) for r in results.values() if r and r.get('success'))
+        total_passed, total_tests, _ = runner._summary
         
         if total_tests == 0:
             print("\nWarning: No tests were executed.")
@@ -0,0 +1,111 @@
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import subprocess
+import unittest.mock
+from pathlib import Path
+
+import bpy
+
+from io_xplane2blender.tests import *
+
+__dirname__ = os.path.dirname(__file__)
+
+# test_suite_runner.py is a Blender script, not part of a package
+_spec = importlib.util.spec_from_file_location(
+    "test_suite_runner", Path(__dirname__, "test_suite_runner.py")
+)
+test_suite_runner = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(test_suite_runner)
+
+
+def _shard(category: str) -> dict:
+    """The JSON a worker writes for category, with one passing test"""
+    return {
+        'success': True,
+        'results': [[f"test_{category}", True, "Passed"]],
+        'test_results': {
+            category: {
+                'test': [f"{category}_check"],
+                'success': [True],
+                'message': ["ok"],
+                'details': [""],
+            }
+        },
+        'diagnostics': {'errors': [], 'warnings': [f"{category} warning"]},
+    }
+
+
+def _fake_worker(failing_category: str = None, returncode: int = 0):
+    """
+    A subprocess.run stand-in that writes each worker's results to its --json path.
+    The failing_category worker exits with returncode and writes nothing
+    """
+    def run(cmd, **kwargs):
+        category = cmd[cmd.index("--category") + 1]
+        if category == failing_category:
+            return subprocess.CompletedProcess(cmd, returncode, stdout=f"{category} worker crashed")
+        with open(cmd[cmd.index("--json") + 1], "w") as f:
+            json.dump(_shard(category), f)
+        return subprocess.CompletedProcess(cmd, 0, stdout=f"{category} worker output")
+    return run
+
+
+class TestIntegrationShards(XPlaneTestCase):
+    def setUp(self):
+        super().setUp()
+        self.runner = test_suite_runner.TestSuiteRunner()
+        self.runner.jobs = 2
+
+    def run_shards(self, fake_worker) -> tuple:
+        """Runs the shards with fake_worker in place of Blender, returning (results, printed text)"""
+        printed = io.StringIO()
+        with unittest.mock.patch.object(test_suite_runner.subprocess, "run", side_effect=fake_worker), \
+                contextlib.redirect_stdout(printed):
+            results = self.runner.run_integration_shards()
+        return results, printed.getvalue()
+
+    def test_shards_merged(self):
+        categories = list(test_suite_runner.INTEGRATION_TEST_CATEGORIES)
+        results, printed = self.run_shards(_fake_worker())
+
+        self.assertTrue(results['success'])
+        self.assertEqual(results['total'], len(categories))
+        self.assertEqual(results['passed'], len(categories))
+        self.assertEqual(
+            results['results'],
+            [(f"test_{category}", True, "Passed") for category in categories],
+        )
+        self.assertEqual(set(results['test_results']), set(categories))
+        self.assertEqual(
+            results['diagnostics']['warnings'],
+            [f"{category} warning" for category in categories],
+        )
+        # Passing workers stay quiet without --verbose
+        self.assertNotIn("worker output", printed)
+
+    def test_failing_shard_output_printed(self):
+        failing, *passing = test_suite_runner.INTEGRATION_TEST_CATEGORIES
+        results, printed = self.run_shards(_fake_worker(failing, returncode=1))
+
+        self.assertEqual(results['total'], len(passing) + 1)
+        self.assertEqual(results['passed'], len(passing))
+        self.assertIn((failing, False), [result[:2] for result in results['results']])
+        self.assertNotIn(failing, results['test_results'])
+
+        # The failing worker's output is shown even without --verbose
+        self.assertIn(f"{failing} worker crashed", printed)
+        self.assertIn("exit code 1", printed)
+
+    def test_missing_results_output_printed(self):
+        failing = next(iter(test_suite_runner.INTEGRATION_TEST_CATEGORIES))
+        results, printed = self.run_shards(_fake_worker(failing, returncode=0))
+
+        self.assertIn((failing, False), [result[:2] for result in results['results']])
+        self.assertIn(f"{failing} worker crashed", printed)
+        self.assertIn("exit code 0", printed)
+
+
+runTestCases([TestIntegrationShards])
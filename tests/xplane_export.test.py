@@ -31,18 +31,17 @@ class TestXPlaneExport(XPlaneTestCase):
         cube.data.materials.append(material)
         
         # Ensure we have a collection named "Collection"
-        if "Collection" not in bpy.data.collections:
+        collection = bpy.data.collections.get("Collection")
+        if collection is None:
             collection = bpy.data.collections.new("Collection")
             bpy.context.scene.collection.children.link(collection)
-        else:
-            collection = bpy.data.collections["Collection"]
         
         # Make sure the cube is in the Collection
-        if cube.name not in collection.objects:
+        if collection.objects.get(cube.name) is None:
             collection.objects.link(cube)
         
         # Remove from scene collection if it's there
-        if cube.name in bpy.context.scene.collection.objects:
+        if bpy.context.scene.collection.objects.get(cube.name) is not None:
             bpy.context.scene.collection.objects.unlink(cube)
         
         # Create tmp directory if it doesn't exist
@@ -76,10 +75,10 @@ class TestXPlaneExport(XPlaneTestCase):
         
         # Try to find the default collection - in Blender 4.4 it might be named differently
         collection_name = 'Collection'
-        if collection_name not in bpy.data.collections:
+        if bpy.data.collections.get(collection_name) is None:
             # Try common alternative names
             for alt_name in ['Scene Collection', 'Master Collection', list(bpy.data.collections.keys())[0] if bpy.data.collections else None]:
-                if alt_name and alt_name in bpy.data.collections:
+                if alt_name and bpy.data.collections.get(alt_name) is not None:
                     collection_name = alt_name
                     break
         
@@ -116,10 +115,10 @@ class TestXPlaneExport(XPlaneTestCase):
         
         # Try to find the default collection - in Blender 4.4 it might be named differently
         collection_name = 'Collection'
-        if collection_name not in bpy.data.collections:
+        if bpy.data.collections.get(collection_name) is None:
             # Try common alternative names
             for alt_name in ['Scene Collection', 'Master Collection', list(bpy.data.collections.keys())[0] if bpy.data.collections else None]:
-                if alt_name and alt_name in bpy.data.collections:
+                if alt_name and bpy.data.collections.get(alt_name) is not None:
                     collection_name = alt_name
                     break
         